@@ -1,18 +1,43 @@
 from uuid import uuid4
+import asyncio
+import hashlib
+import json
+import logging
+import math
 import os
+import re
+import subprocess
 import tempfile
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Dict
-
-from fastapi import FastAPI, BackgroundTasks, UploadFile, File, WebSocket
+from functools import partial
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from fastapi import (
+    FastAPI,
+    BackgroundTasks,
+    UploadFile,
+    File,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import numpy as np
-import whisper
-from pytube import YouTube
+import redis.asyncio as redis
+import soundfile as sf
+from diskcache import Cache
+import ctranslate2
+from faster_whisper import WhisperModel
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.vad import collect_chunks, get_speech_timestamps
+from numba import njit
 from pydub import AudioSegment
-
-# Initialize the app
-app = FastAPI()
+from scipy.signal import resample_poly
 
 
 # Schema for youtube transcription api
@@ -20,11 +45,728 @@ class YoutubeUrl(BaseModel):
     youtube_url: str
 
 
-# In-memory storage for task status
-tasks = {}
+logger = logging.getLogger(__name__)
+
+# Redis storage for task status, shared by all worker processes
+REDIS_URL = os.getenv("VERBALIZE_REDIS_URL", "redis://localhost:6379/0")
+redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+
+# Time after which the status of a finished task expires, in seconds
+TASK_TTL_S = 3600
+
+# Time after which the status of a processing task expires unless it is kept alive,
+# so tasks of a worker that died are not left processing, in seconds
+TASK_PROCESSING_TTL_S = 120
+
+# Interval at which processing tasks are kept alive, in seconds
+TASK_HEARTBEAT_S = 30
+
+# Interval at which status listeners re-read a task without updates, in seconds
+STATUS_RECHECK_S = 15
+
+# Time after which cached transcriptions, shared by all worker processes, expire
+TRANSCRIPTION_TTL_S = 7 * 24 * 3600
+
+# Log-mel windows of previously decoded uploads, shared by all worker processes
+FEATURE_CACHE_DIR = os.getenv(
+    "VERBALIZE_FEATURE_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "verbalizeit-features"),
+)
+feature_cache = Cache(FEATURE_CACHE_DIR, size_limit=2**30)
+
+# Select the inference device, preferring the GPU when one is available
+DEVICE = os.getenv(
+    "VERBALIZE_DEVICE", "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+)
+
+# Use int8 weights, with fp16 activations on the GPU
+COMPUTE_TYPE = os.getenv(
+    "VERBALIZE_COMPUTE_TYPE", "int8_float16" if DEVICE.startswith("cuda") else "int8"
+)
+
+# Name of the Whisper model or path to a converted CTranslate2 model directory
+MODEL_NAME = os.getenv("VERBALIZE_MODEL", "tiny.en")
+
+# Language of uploads and YouTube videos, detected per window by multilingual models
+# when unset
+LANGUAGE = os.getenv("VERBALIZE_LANGUAGE")
+
+# Number of worker processes, which uvicorn also reads as its default --workers
+WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+# Number of CPUs the process may run on, respecting the CPU affinity of the container
+# like nproc does, where the platform supports it
+CPU_COUNT = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else os.cpu_count() or 1
+)
+
+# CPU threads of each worker's model, split so workers do not oversubscribe cores
+CPU_THREADS = int(os.getenv("VERBALIZE_CPU_THREADS", str(max(1, CPU_COUNT // WORKERS))))
+
+# Sampling rate expected by the Whisper model
+SAMPLING_RATE = 16000
+
+# Largest int16 sample value, used to normalize PCM audio
+INT16_MAX = np.iinfo(np.int16).max
+
+# Number of bytes in 30 seconds of streamed 16-bit audio
+STREAM_WINDOW_BYTES = 30 * SAMPLING_RATE * 2
+
+# Number of streamed windows read ahead of their transcription
+STREAM_READ_AHEAD_WINDOWS = 4
+
+# Number of trailing characters of error output logged for a failed stream
+STREAM_ERROR_CHARS = 500
+
+# Maximum number of 30 second windows decoded together
+BATCH_SIZE = 8
+
+# Maximum time to wait for a batch to fill up, in seconds
+BATCH_MAX_WAIT_S = 0.02
+
+# Windows more likely than this to contain no speech are dropped, as in faster-whisper,
+# unless their text was decoded with an average log-probability above LOG_PROB_THRESHOLD
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+
+# Minimum duration of live audio transcribed at once, in samples
+LIVE_MIN_SAMPLES = SAMPLING_RATE
+
+# Capacity of the per-connection live audio buffer, in samples
+LIVE_BUFFER_SAMPLES = 30 * SAMPLING_RATE
+
+# Live audio chunks with a lower RMS level are treated as silence (about -40 dBFS)
+SILENCE_RMS_THRESHOLD = 0.01
+
+# Queue of log-mel windows waiting to be decoded with the future of their text
+batch_queue: "asyncio.Queue[Tuple[np.ndarray, asyncio.Future]]" = asyncio.Queue()
+
+
+@dataclass
+class _ModelState:
+    """
+    Holds the Whisper model so that it is loaded at most once per process.
+
+    Attributes:
+        _model (Optional[WhisperModel]): The loaded model, or None until first use.
+        _lock (threading.Lock): Guards the model against concurrent loading.
+    """
+
+    _model: Optional[WhisperModel] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_model_state = _ModelState()
+
+
+def get_model() -> WhisperModel:
+    """
+    Returns the process wide Whisper model, loading it on first use.
+
+    The model is cached in the module level '_model_state', so reloaded or
+    additional worker processes pay the loading cost once instead of per call.
+
+    Returns:
+        WhisperModel: The loaded Whisper model.
+    """
+    if _model_state._model is None:
+        with _model_state._lock:
+            # Check again in case another thread loaded the model while waiting
+            if _model_state._model is None:
+                _model_state._model = WhisperModel(
+                    MODEL_NAME,
+                    device=DEVICE,
+                    compute_type=COMPUTE_TYPE,
+                    cpu_threads=CPU_THREADS,
+                )
+
+    return _model_state._model
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Loads and warms up the Whisper model when the application starts.
+
+    Args:
+        app (FastAPI): The application being started.
+    """
+    warm_up_model()
+
+    # Start decoding queued windows in the background
+    worker = asyncio.create_task(batch_worker())
+    yield
+    worker.cancel()
+
+    await redis_client.aclose()
+
+
+# Initialize the app
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+
+def transcribe_audio(audio: np.ndarray, **options) -> str:
+    """
+    Transcribes audio with the Whisper model using greedy decoding.
+
+    Args:
+        audio (np.ndarray): A 16kHz mono waveform.
+        **options: Additional keyword arguments forwarded to the model's transcribe method.
+
+    Returns:
+        str: The transcribed text.
+    """
+    # Segments are generated lazily, decoding happens while joining them
+    segments, _ = get_model().transcribe(audio, beam_size=1, **options)
+    return "".join(segment.text for segment in segments)
+
+
+def compute_feature_windows(audio: np.ndarray) -> List[np.ndarray]:
+    """
+    Splits a waveform into the 30 second log-mel windows consumed by the Whisper encoder.
+
+    Non-speech parts are removed with the Silero VAD first, as with faster-whisper's
+    'vad_filter', so silence and music do not reach the decoder.
+
+    Args:
+        audio (np.ndarray): A 16kHz mono waveform.
+
+    Returns:
+        List[np.ndarray]: The log-mel windows, each of shape (n_mels, 3000).
+    """
+    feature_extractor = get_model().feature_extractor
+    window_frames = feature_extractor.nb_max_frames
+
+    # Keep only the speech, audio without any yields no windows
+    audio = collect_chunks(audio, get_speech_timestamps(audio))
+
+    # The extractor pads the audio with one extra window of silence
+    features = feature_extractor(audio)
+    content_frames = features.shape[-1] - window_frames
+
+    return [
+        features[:, seek : seek + window_frames]
+        for seek in range(0, content_frames, window_frames)
+    ]
+
+
+def load_feature_windows(
+    cache_key: str, load_audio: Callable[[], np.ndarray]
+) -> List[np.ndarray]:
+    """
+    Returns the log-mel windows of some audio, computing them only on a cache miss.
+
+    The windows are kept in the on-disk 'feature_cache', so retried uploads skip
+    both audio decoding and feature extraction. The cache is shared by every
+    worker, so entries are also keyed by the model and its number of mel bins,
+    which keeps windows of a differently configured model from being reused.
+
+    Args:
+        cache_key (str): The key under which the windows are cached.
+        load_audio (Callable[[], np.ndarray]): Returns the 16kHz mono waveform,
+            only called when the windows are not cached.
+
+    Returns:
+        List[np.ndarray]: The log-mel windows, each of shape (n_mels, 3000).
+    """
+    n_mels = get_model().feature_extractor.mel_filters.shape[0]
+    feature_key = f"{cache_key}:{MODEL_NAME}:{n_mels}"
+    windows = feature_cache.get(feature_key)
+
+    if windows is None:
+        windows = compute_feature_windows(load_audio())
+        feature_cache.set(feature_key, windows)
 
-# Load the Whisper model
-model = whisper.load_model("tiny.en")
+    return windows
+
+
+def decode_batch(features: np.ndarray) -> List[str]:
+    """
+    Decodes a batch of log-mel windows with a single encoder and decoder pass.
+
+    Windows whose no-speech probability exceeds NO_SPEECH_THRESHOLD, and whose
+    text was not decoded confidently, are transcribed as an empty text instead of
+    the text hallucinated for them. Multilingual models transcribe every window
+    in LANGUAGE, or in the language detected for it when LANGUAGE is unset.
+
+    Args:
+        features (np.ndarray): The log-mel windows, of shape (batch, n_mels, 3000).
+
+    Returns:
+        List[str]: The transcribed text of each window.
+    """
+    model = get_model()
+    multilingual = model.model.is_multilingual
+
+    # Encode once, the output is shared by language detection and decoding
+    encoder_output = model.encode(np.ascontiguousarray(features))
+
+    if not multilingual:
+        languages = ["en"] * len(features)
+    elif LANGUAGE is not None:
+        languages = [LANGUAGE] * len(features)
+    else:
+        # Take the most likely language token of each window, e.g. "<|de|>"
+        languages = [
+            result[0][0][2:-2] for result in model.model.detect_language(encoder_output)
+        ]
+
+    tokenizers = {
+        language: Tokenizer(
+            model.hf_tokenizer, multilingual, task="transcribe", language=language
+        )
+        for language in set(languages)
+    }
+
+    # Every window starts from the prompt of its language, without timestamp tokens
+    prompts = [
+        tokenizers[language].sot_sequence + [tokenizers[language].no_timestamps]
+        for language in languages
+    ]
+
+    results = model.model.generate(
+        encoder_output,
+        prompts,
+        beam_size=1,
+        return_scores=True,
+        return_no_speech_prob=True,
+    )
+
+    texts = []
+    for result, language in zip(results, languages):
+        tokens = result.sequences_ids[0]
+
+        # Scores are normalized by the length, average over the end token as well
+        avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+
+        if (
+            result.no_speech_prob > NO_SPEECH_THRESHOLD
+            and avg_logprob <= LOG_PROB_THRESHOLD
+        ):
+            texts.append("")
+        else:
+            texts.append(tokenizers[language].decode(tokens))
+
+    return texts
+
+
+def warm_up_model() -> None:
+    """
+    Loads the Whisper model and runs one second of silence through it.
+
+    Numba compiles the PCM conversion, the VAD model is loaded, and CTranslate2
+    selects its kernels and allocates its buffers on the first call, so warming up
+    keeps these one-off costs out of the first transcription request.
+    """
+    feature_extractor = get_model().feature_extractor
+    n_mels = feature_extractor.mel_filters.shape[0]
+
+    # Convert a read-only buffer, like real requests do, as Numba compiles writable
+    # and read-only arrays separately
+    silence = int16_to_float32(np.frombuffer(bytes(2 * SAMPLING_RATE), dtype=np.int16))
+
+    # The VAD drops the silence, so decode an empty window separately
+    compute_feature_windows(silence)
+    window = np.zeros((1, n_mels, feature_extractor.nb_max_frames), dtype=np.float32)
+    decode_batch(window)
+
+
+async def batch_worker() -> None:
+    """
+    Decodes the windows submitted to 'batch_queue' in batches.
+
+    The worker waits for a window, then collects up to BATCH_SIZE windows for at
+    most BATCH_MAX_WAIT_S seconds, so windows from concurrent requests share a
+    single pass through the model. Decoding runs in the threadpool, as CTranslate2
+    releases the GIL, so the event loop stays responsive. Results are routed back
+    through the futures queued with each window.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await batch_queue.get()]
+        deadline = loop.time() + BATCH_MAX_WAIT_S
+
+        # Collect more windows until the batch is full or the deadline passes
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            texts = await run_in_threadpool(
+                decode_batch, np.stack([window for window, _ in batch])
+            )
+        except Exception as e:
+            # Propagate the error to every request in the batch
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+
+
+async def transcribe_windows(windows: List[np.ndarray]) -> str:
+    """
+    Transcribes log-mel windows by submitting them to the batch worker.
+
+    Args:
+        windows (List[np.ndarray]): The log-mel windows, each of shape (n_mels, 3000).
+
+    Returns:
+        str: The transcribed text.
+    """
+    loop = asyncio.get_running_loop()
+    futures = []
+
+    # Queue every window along with a future for its text
+    for window in windows:
+        future = loop.create_future()
+        await batch_queue.put((window, future))
+        futures.append(future)
+
+    texts = await asyncio.gather(*futures)
+    return "".join(texts)
+
+
+async def transcribe_batched(audio: np.ndarray) -> str:
+    """
+    Transcribes a waveform by submitting its 30 second windows to the batch worker.
+
+    Args:
+        audio (np.ndarray): A 16kHz mono waveform.
+
+    Returns:
+        str: The transcribed text.
+    """
+    windows = await run_in_threadpool(compute_feature_windows, audio)
+    return await transcribe_windows(windows)
+
+
+@njit(fastmath=True, cache=True)
+def int16_to_float32(samples: np.ndarray) -> np.ndarray:
+    """
+    Converts int16 PCM samples to float32 samples normalized to the range [-1.0, 1.0].
+
+    The conversion and normalization are fused into a single pass, compiled with
+    Numba into a single-threaded vectorized loop. It is called concurrently from
+    the threadpool, which Numba's parallel threading layers do not support.
+
+    Args:
+        samples (np.ndarray): The int16 PCM samples.
+
+    Returns:
+        np.ndarray: The normalized float32 samples.
+    """
+    audio_np = np.empty(samples.shape[0], dtype=np.float32)
+    scale = np.float32(1.0 / INT16_MAX)
+
+    for i in range(samples.shape[0]):
+        audio_np[i] = samples[i] * scale
+
+    return audio_np
+
+
+def decode_audio_bytes(audio_bytes: bytes) -> np.ndarray:
+    """
+    Decodes an encoded audio file into a 16kHz mono waveform.
+
+    Formats supported by libsndfile, such as .wav, are decoded in process with
+    soundfile. Any other format falls back to pydub, which decodes through ffmpeg.
+
+    Args:
+        audio_bytes (bytes): The content of the audio file.
+
+    Returns:
+        np.ndarray: The waveform as float32 samples in the range [-1.0, 1.0].
+    """
+    try:
+        audio_np, sample_rate = sf.read(
+            BytesIO(audio_bytes), dtype="float32", always_2d=False
+        )
+    except sf.LibsndfileError:
+        # Use pydub to handle other audio formats and convert audio
+        audio = AudioSegment.from_file(BytesIO(audio_bytes))
+        audio = audio.set_channels(1).set_frame_rate(SAMPLING_RATE).set_sample_width(2)
+
+        # Convert the raw data into a NumPy array for processing
+        return int16_to_float32(np.frombuffer(audio.raw_data, dtype=np.int16))
+
+    # Downmix multi-channel audio to mono
+    if audio_np.ndim > 1:
+        audio_np = audio_np.mean(axis=1, dtype=np.float32)
+
+    # Resample to the model sampling rate with a polyphase filter
+    if sample_rate != SAMPLING_RATE:
+        divisor = math.gcd(sample_rate, SAMPLING_RATE)
+        audio_np = resample_poly(
+            audio_np, SAMPLING_RATE // divisor, sample_rate // divisor
+        ).astype(np.float32, copy=False)
+
+    return audio_np
+
+
+def task_key(task_id: str) -> str:
+    """
+    Builds the Redis key, and pub/sub channel, of a transcription task.
+
+    Args:
+        task_id (str): The unique identifier of the transcription task.
+
+    Returns:
+        str: The Redis key of the task.
+    """
+    return f"task:{task_id}"
+
+
+async def get_task(task_id: str) -> Dict[str, str]:
+    """
+    Retrieves the status of a task from Redis.
+
+    Args:
+        task_id (str): The unique identifier of the transcription task.
+
+    Returns:
+        Dict[str, str]: The status of the task, or an empty dictionary if it does
+        not exist or has expired.
+    """
+    return await redis_client.hgetall(task_key(task_id))
+
+
+async def update_task(task_id: str, status: Dict[str, str]) -> None:
+    """
+    Stores the status of a task in Redis and publishes it to status listeners.
+
+    The status replaces any previous one. Finished tasks expire after TASK_TTL_S
+    seconds, processing ones after TASK_PROCESSING_TTL_S seconds unless they are
+    kept alive by 'keep_task_alive'.
+
+    Args:
+        task_id (str): The unique identifier of the transcription task.
+        status (Dict[str, str]): The new status of the task.
+    """
+    key = task_key(task_id)
+    ttl = TASK_PROCESSING_TTL_S if status["status"] == "processing" else TASK_TTL_S
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        pipe.hset(key, mapping=status)
+        pipe.expire(key, ttl)
+        pipe.publish(key, json.dumps(status))
+        await pipe.execute()
+
+
+async def keep_task_alive(task_id: str) -> None:
+    """
+    Periodically extends the expiry of a processing task until it is cancelled.
+
+    The expiry is only ever extended, so a finished status that was stored in the
+    meantime keeps its longer TTL.
+
+    Args:
+        task_id (str): The unique identifier of the transcription task.
+    """
+    while True:
+        await asyncio.sleep(TASK_HEARTBEAT_S)
+        await redis_client.expire(task_key(task_id), TASK_PROCESSING_TTL_S, gt=True)
+
+
+def transcription_key(cache_key: str) -> str:
+    """
+    Returns the Redis key under which a transcription is cached.
+
+    The cache outlives restarts and is shared by every worker, so the key also
+    holds the model, compute type and language the transcription was made with,
+    which keeps transcriptions of a differently configured model from being reused.
+
+    Args:
+        cache_key (str): The content hash or video ID of the transcribed audio.
+
+    Returns:
+        str: The Redis key of the cached transcription.
+    """
+    return f"transcription:{MODEL_NAME}:{COMPUTE_TYPE}:{LANGUAGE}:{cache_key}"
+
+
+async def get_cached_transcription(cache_key: str) -> Optional[str]:
+    """
+    Retrieves a previously cached transcription from Redis.
+
+    Args:
+        cache_key (str): The content hash or video ID of the transcribed audio.
+
+    Returns:
+        Optional[str]: The cached transcription, or None if it is not cached.
+    """
+    return await redis_client.get(transcription_key(cache_key))
+
+
+async def cache_transcription(cache_key: str, transcription: str) -> None:
+    """
+    Caches a transcription in Redis for TRANSCRIPTION_TTL_S seconds.
+
+    Args:
+        cache_key (str): The content hash or video ID of the transcribed audio.
+        transcription (str): The transcription to cache.
+    """
+    await redis_client.set(
+        transcription_key(cache_key), transcription, ex=TRANSCRIPTION_TTL_S
+    )
+
+
+def file_cache_key(audio_bytes: bytes) -> str:
+    """
+    Builds the transcription cache key of an uploaded audio file from its content.
+
+    Args:
+        audio_bytes (bytes): The content of the audio file.
+
+    Returns:
+        str: The cache key of the file.
+    """
+    return f"file:{hashlib.blake2b(audio_bytes).hexdigest()}"
+
+
+def youtube_video_id(youtube_url: str) -> Optional[str]:
+    """
+    Extracts the video ID from the URL of a YouTube video.
+
+    The video ID is taken from the 'v' query parameter of YouTube URLs, or from
+    the path of youtu.be, /embed/, /shorts/ and /live/ URLs. Only http(s) URLs of
+    YouTube hosts are accepted, as the ID is all that is handed over to yt-dlp.
+
+    Args:
+        youtube_url (str): The URL of the YouTube video.
+
+    Returns:
+        Optional[str]: The 11 character video ID, or None if the URL is not the
+        URL of a YouTube video.
+    """
+    parsed_url = urlparse(youtube_url)
+    if parsed_url.scheme not in ("http", "https"):
+        return None
+
+    host = (parsed_url.hostname or "").lower()
+    path_segments = [segment for segment in parsed_url.path.split("/") if segment]
+
+    video_id = None
+    if host == "youtu.be":
+        video_id = path_segments[0] if path_segments else None
+    elif host in ("youtube.com", "youtube-nocookie.com") or host.endswith(
+        (".youtube.com", ".youtube-nocookie.com")
+    ):
+        video_id = parse_qs(parsed_url.query).get("v", [None])[0]
+
+        # Fall back to the path of embedded, short and live video URLs
+        if (
+            video_id is None
+            and len(path_segments) >= 2
+            and path_segments[0] in ("embed", "shorts", "live")
+        ):
+            video_id = path_segments[1]
+
+    if video_id is not None and re.fullmatch(r"[0-9A-Za-z_-]{11}", video_id):
+        return video_id
+
+    return None
+
+
+def youtube_cache_key(youtube_url: str) -> str:
+    """
+    Builds the transcription cache key of a YouTube video from its video ID.
+
+    Different URLs of the same video share a cache entry. URLs without a valid
+    video ID are used as is.
+
+    Args:
+        youtube_url (str): The URL of the YouTube video.
+
+    Returns:
+        str: The cache key of the video.
+    """
+    video_id = youtube_video_id(youtube_url)
+    return f"youtube:{video_id if video_id is not None else youtube_url}"
+
+
+def is_silent(audio: np.ndarray) -> bool:
+    """
+    Checks whether an audio chunk is too quiet to contain speech.
+
+    Args:
+        audio (np.ndarray): The float32 samples of the chunk.
+
+    Returns:
+        bool: True if the RMS level of the chunk is below SILENCE_RMS_THRESHOLD.
+    """
+    if audio.size == 0:
+        return True
+
+    # The dot product computes the sum of squares without a temporary array
+    rms = np.sqrt(np.dot(audio, audio) / audio.size)
+    return rms < SILENCE_RMS_THRESHOLD
+
+
+class LiveAudioBuffer:
+    """
+    Accumulates the live audio frames of a WebSocket connection until they span
+    enough audio to be transcribed.
+
+    Frames are written into a single contiguous float32 buffer that is allocated
+    once per connection. A frame that is long enough on its own while nothing is
+    pending is returned as is, so the common case does not copy any samples.
+
+    Args:
+        min_samples (int): Minimum number of samples returned for transcription.
+        capacity (int): Number of samples the buffer can hold.
+    """
+
+    def __init__(self, min_samples: int, capacity: int) -> None:
+        self._min_samples = min_samples
+        self._buffer = np.empty(capacity, dtype=np.float32)
+        self._size = 0
+
+    def push(self, samples: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Adds a frame to the buffer and returns the pending audio once it is long enough.
+
+        The returned array may be a view of the buffer, it is only valid until the
+        next call to push.
+
+        Args:
+            samples (np.ndarray): The float32 samples of the received frame.
+
+        Returns:
+            Optional[np.ndarray]: The pending audio, or None if it is still too short.
+        """
+        # Pass long enough frames through without copying them
+        if self._size == 0 and samples.shape[0] >= self._min_samples:
+            return samples
+
+        end = self._size + samples.shape[0]
+
+        # Frames that do not fit are joined with the pending audio in a new array
+        if end > self._buffer.shape[0]:
+            audio = np.concatenate((self._buffer[: self._size], samples))
+            self._size = 0
+            return audio
+
+        self._buffer[self._size : end] = samples
+        self._size = end
+
+        if self._size < self._min_samples:
+            return None
+
+        # Hand out the pending audio and start filling the buffer from the start
+        self._size = 0
+        return self._buffer[:end]
 
 
 def create_task_id() -> str:
@@ -41,116 +783,297 @@ def create_task_id() -> str:
     return str(uuid4())
 
 
-async def process_local_audio_file(task_id: str, upload_file: UploadFile) -> None:
+async def process_local_audio_file(
+    task_id: str, audio_bytes: bytes, cache_key: str
+) -> None:
     """
     Processes an uploaded audio file for transcription using the Whisper model.
 
-    This function reads an audio file from an UploadFile object, processes it,
-    and transcribes it using the globally loaded Whisper model. The result of the
-    transcription is stored in the global 'tasks' dictionary.
+    This function decodes the content of an uploaded audio file and transcribes it
+    using the Whisper model. The result of the transcription is stored in the task
+    status and in the transcription cache.
 
     Args:
         task_id (str): A unique identifier for the transcription task.
-        upload_file (UploadFile): The audio file uploaded by the user.
+        audio_bytes (bytes): The content of the audio file uploaded by the user.
+        cache_key (str): The key under which the transcription is cached.
 
     Raises:
         Exception: If an error occurs during file processing or transcription.
     """
+    # Keep the task from expiring while it is processed
+    heartbeat = asyncio.create_task(keep_task_alive(task_id))
     try:
-        # Extract the audio bytes from the uploaded file
-        audio_bytes = await upload_file.read()
-
-        # Use pydub to handle different audio formats and convert audio
-        audio = AudioSegment.from_file(BytesIO(audio_bytes))
-        audio = audio.set_channels(1).set_frame_rate(16000)
-
-        # Convert the audio to a raw data byte string
-        raw_data = audio.raw_data
-
-        # Convert the raw data into a NumPy array for processing
-        audio_np = np.frombuffer(raw_data, dtype=np.int16).astype(np.float32)
-        audio_np /= np.iinfo(np.int16).max  # Normalize to range [-1.0, 1.0]
+        # Decode the audio and extract its log-mel windows, unless they are cached
+        windows = await run_in_threadpool(
+            load_feature_windows, cache_key, partial(decode_audio_bytes, audio_bytes)
+        )
 
-        # Transcribe the audio using the Whisper model
-        result = model.transcribe(audio_np)
-        transcription = result.get("text")
+        # Transcribe the audio using the batched Whisper model
+        transcription = await transcribe_windows(windows)
+        await cache_transcription(cache_key, transcription)
 
         # Update the task status with the transcription result
-        tasks[task_id] = {"status": "completed", "transcription": transcription}
+        await update_task(
+            task_id, {"status": "completed", "transcription": transcription}
+        )
     except Exception as e:
         # Handle any errors that occur during the processing
-        tasks[task_id] = {"status": "failed", "error": str(e)}
+        await update_task(task_id, {"status": "failed", "error": str(e)})
+    finally:
+        heartbeat.cancel()
 
 
-def download_youtube_audio(youtube_url: str) -> str:
+class YouTubeAudioStream:
     """
-    Downloads the audio stream of a YouTube video to a temporary file.
+    Streams the audio of a YouTube video as 30 second windows of 16kHz mono audio.
 
-    Given a YouTube URL, this function downloads the audio stream with the highest bitrate
-    available and saves it to a temporary file. The path to the saved audio file is then returned.
+    The best audio stream of the video is downloaded with yt-dlp and piped straight
+    into ffmpeg for decoding, so windows are available before the download has
+    finished and nothing but the error output of both processes is written to disk.
 
     Args:
-        youtube_url (str): The URL of the YouTube video from which to download the audio.
-
-    Returns:
-        str: The file path to the downloaded audio file.
-
-    Raises:
-        PytubeError: If an error occurs in downloading the audio from YouTube.
+        video_id (str): The validated ID of the YouTube video from which to stream
+            the audio.
     """
-    try:
-        # Initialize a YouTube object with the given URL
-        yt = YouTube(youtube_url)
 
-        # Select the highest bitrate audio stream available
-        audio_stream = (
-            yt.streams.filter(only_audio=True).order_by("bitrate").desc().first()
+    def __init__(self, video_id: str) -> None:
+        self._downloader_errors = None
+        self._decoder_errors = None
+        self._downloader = None
+        self._decoder = None
+
+        try:
+            self._start(video_id)
+        except BaseException:
+            # Stop whatever was already started before the failure
+            self.close()
+            raise
+
+    def _start(self, video_id: str) -> None:
+        """
+        Starts the download and decoding processes.
+
+        Args:
+            video_id (str): The validated ID of the YouTube video.
+        """
+        # Error output goes to files, a full pipe would block the processes
+        self._downloader_errors = tempfile.TemporaryFile()
+        self._decoder_errors = tempfile.TemporaryFile()
+
+        self._downloader = subprocess.Popen(
+            [
+                "yt-dlp",
+                "--quiet",
+                "--format",
+                "bestaudio",
+                "--output",
+                "-",
+                # Nothing after the separator is parsed as an option
+                "--",
+                f"https://www.youtube.com/watch?v={video_id}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=self._downloader_errors,
+        )
+        self._decoder = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-loglevel",
+                "error",
+                "-i",
+                "pipe:0",
+                "-f",
+                "s16le",
+                "-ac",
+                "1",
+                "-ar",
+                str(SAMPLING_RATE),
+                "pipe:1",
+            ],
+            stdin=self._downloader.stdout,
+            stdout=subprocess.PIPE,
+            stderr=self._decoder_errors,
         )
 
-        # Generate a temporary file path for storing the downloaded audio
-        temp_dir = tempfile.gettempdir()
-        temp_filename = audio_stream.default_filename
-        temp_filepath = os.path.join(temp_dir, temp_filename)
+        # Only ffmpeg reads the download, so yt-dlp stops if ffmpeg exits early
+        self._downloader.stdout.close()
+
+    def read_window(self) -> Optional[np.ndarray]:
+        """
+        Reads the next window of the audio, blocking until it has been decoded.
+
+        Returns:
+            Optional[np.ndarray]: The window as float32 samples, the last one may be
+            shorter, or None once the stream has ended.
+
+        Raises:
+            Exception: If an error occurs in downloading or decoding the audio.
+        """
+        raw_data = self._decoder.stdout.read(STREAM_WINDOW_BYTES)
+        if raw_data:
+            return int16_to_float32(np.frombuffer(raw_data, dtype=np.int16))
+
+        # Surface download or decoding failures once the stream is exhausted
+        if self._downloader.wait() != 0 or self._decoder.wait() != 0:
+            raise Exception(f"Error downloading YouTube audio: {self._log_failures()}")
+
+        return None
+
+    def _log_failures(self) -> str:
+        """
+        Logs the end of the error output of the processes that failed.
+
+        The error output can reveal details of the server, so it is only logged and
+        clients are merely told which processes failed.
+
+        Returns:
+            str: The description of the failures.
+        """
+        failures = []
+        for name, process, errors in (
+            ("yt-dlp", self._downloader, self._downloader_errors),
+            ("ffmpeg", self._decoder, self._decoder_errors),
+        ):
+            if process.returncode != 0:
+                errors.seek(0)
+                output = errors.read().decode(errors="replace").strip()
+                logger.error(
+                    "%s exited with code %d: %s",
+                    name,
+                    process.returncode,
+                    output[-STREAM_ERROR_CHARS:],
+                )
+                failures.append(f"{name} exited with code {process.returncode}")
+
+        return "; ".join(failures)
+
+    def close(self) -> None:
+        """
+        Stops both processes, unblocking any thread waiting in read_window.
+
+        Processes and files that were never started, because starting the stream
+        failed, are skipped.
+        """
+        for process in (self._downloader, self._decoder):
+            if process is None:
+                continue
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            if process.stdout is not None:
+                process.stdout.close()
+
+        for errors in (self._downloader_errors, self._decoder_errors):
+            if errors is not None:
+                errors.close()
+
+
+async def read_youtube_windows(
+    stream: YouTubeAudioStream, pending: "asyncio.Queue[Optional[asyncio.Future]]"
+) -> None:
+    """
+    Reads the windows of a YouTube audio stream and schedules their transcription.
 
-        # Download the audio stream to the temporary file
-        audio_stream.download(output_path=temp_dir, filename=temp_filename)
+    Every window is submitted to the batch worker as soon as it has been read, so
+    the download keeps running during transcription and windows of the same video
+    can share a batch. The futures of their text are queued in order on 'pending',
+    whose bound stops reading once that many windows are waiting for their text.
+    None is queued once the stream has ended, and a failed future if reading fails.
 
-        return temp_filepath
+    Args:
+        stream (YouTubeAudioStream): The audio stream of the video.
+        pending (asyncio.Queue[Optional[asyncio.Future]]): The queue receiving the
+            futures of the window transcriptions.
+    """
+    try:
+        while True:
+            # Wait for the next window of audio to be downloaded
+            window = await run_in_threadpool(stream.read_window)
+            if window is None:
+                break
+
+            transcription = asyncio.ensure_future(transcribe_batched(window))
+            try:
+                await pending.put(transcription)
+            except asyncio.CancelledError:
+                transcription.cancel()
+                raise
     except Exception as e:
-        # TODO Consider specific exception handling related to Pytube or network issues
-        raise Exception(f"Error downloading YouTube audio: {e}")
+        # Hand the error over in place of the text of the next window
+        error = asyncio.get_running_loop().create_future()
+        error.set_exception(e)
+        await pending.put(error)
+        return
+
+    await pending.put(None)
 
 
-def process_youtube_audio(task_id: str, file_path: str) -> None:
+async def process_youtube_audio(task_id: str, video_id: str, cache_key: str) -> None:
     """
-    Processes and transcribes a YouTube audio file using the Whisper model.
+    Streams and transcribes the audio of a YouTube video using the Whisper model.
 
-    This function reads an audio file from the given file path, transcribes it using
-    the globally loaded Whisper model, and updates the task status in the global
-    'tasks' dictionary. It handles any errors during transcription and ensures
-    that the temporary audio file is removed after processing.
+    This function streams the audio of the given video in 30 second windows, which
+    are read ahead and transcribed using the batched Whisper model as soon as they
+    have been downloaded. The task status is updated with the partial transcription
+    after every window, in order. It handles any errors during processing and
+    ensures that the download is stopped afterwards.
 
     Args:
         task_id (str): The unique identifier of the transcription task.
-        file_path (str): The file path of the audio file to be transcribed.
+        video_id (str): The validated ID of the YouTube video to be transcribed.
+        cache_key (str): The key under which the transcription is cached.
 
     Raises:
-        Exception: If an error occurs during transcription.
+        Exception: If an error occurs during download or transcription.
     """
+    stream: Optional[YouTubeAudioStream] = None
+    reader: Optional[asyncio.Task] = None
+    pending: "asyncio.Queue[Optional[asyncio.Future]]" = asyncio.Queue(
+        maxsize=STREAM_READ_AHEAD_WINDOWS
+    )
+
+    # Keep the task from expiring while it is processed
+    heartbeat = asyncio.create_task(keep_task_alive(task_id))
     try:
-        # Transcribe the audio file using the Whisper model
-        result = model.transcribe(file_path)
-        transcription = result.get("text")
+        stream = YouTubeAudioStream(video_id)
+        reader = asyncio.create_task(read_youtube_windows(stream, pending))
+
+        transcription = ""
+        while True:
+            # Wait for the text of the next window, in order
+            window_transcription = await pending.get()
+            if window_transcription is None:
+                break
+
+            transcription += await window_transcription
+
+            # Publish the partial transcription to status listeners
+            await update_task(
+                task_id, {"status": "processing", "transcription": transcription}
+            )
+
+        await cache_transcription(cache_key, transcription)
 
         # Update the task status with the transcription result
-        tasks[task_id] = {"status": "completed", "transcription": transcription}
+        await update_task(
+            task_id, {"status": "completed", "transcription": transcription}
+        )
     except Exception as e:
-        # Handle any errors that occur during transcription
-        tasks[task_id] = {"status": "failed", "error": str(e)}
+        # Handle any errors that occur during download or transcription
+        await update_task(task_id, {"status": "failed", "error": str(e)})
     finally:
-        # Ensure the temporary file is removed after processing
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # Ensure the download is stopped and pending windows are dropped
+        heartbeat.cancel()
+        if reader is not None:
+            reader.cancel()
+        if stream is not None:
+            await run_in_threadpool(stream.close)
+        while not pending.empty():
+            window_transcription = pending.get_nowait()
+            if window_transcription is not None:
+                window_transcription.cancel()
 
 
 @app.get("/status/{task_id}")
@@ -170,7 +1093,7 @@ async def check_status(task_id: str) -> Dict[str, str]:
         completed, it also includes the transcription text.
     """
     # Retrieve the task by its ID
-    task = tasks.get(task_id)
+    task = await get_task(task_id)
 
     # Check if the task exists and return its status
     if task:
@@ -179,6 +1102,81 @@ async def check_status(task_id: str) -> Dict[str, str]:
     return {"status": "not found"}
 
 
+async def wait_for_disconnect(websocket: WebSocket) -> None:
+    """
+    Waits until the client of a WebSocket disconnects, discarding its messages.
+
+    Args:
+        websocket (WebSocket): The WebSocket connection with the client.
+    """
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@app.websocket("/status-ws/{task_id}")
+async def stream_status(websocket: WebSocket, task_id: str) -> None:
+    """
+    WebSocket endpoint pushing the status of a transcription task.
+
+    The current status of the task is sent as soon as the connection is accepted,
+    followed by every update until the task is no longer processing. This spares
+    clients from polling the status endpoint. Without updates for STATUS_RECHECK_S
+    seconds the stored status is read again, so a task that expired because its
+    worker died is reported as not found instead of keeping the client waiting.
+    Waiting for updates stops as soon as the client disconnects, which releases
+    the Redis subscription of the connection.
+
+    Args:
+        websocket (WebSocket): The WebSocket connection with the client.
+        task_id (str): The unique identifier of the transcription task.
+    """
+    await websocket.accept()
+
+    # Subscribe to updates before reading the current status so none are missed
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(task_key(task_id))
+    disconnected = asyncio.create_task(wait_for_disconnect(websocket))
+    try:
+        task = await get_task(task_id) or {"status": "not found"}
+        await websocket.send_json(task)
+
+        # Forward updates until the task has completed, failed or does not exist
+        while task["status"] == "processing":
+            next_message = asyncio.create_task(
+                pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=STATUS_RECHECK_S
+                )
+            )
+
+            # Stop waiting for the update if the client goes away in the meantime
+            await asyncio.wait(
+                (next_message, disconnected), return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnected.done():
+                next_message.cancel()
+                return
+
+            message = next_message.result()
+            if message is not None:
+                task = json.loads(message["data"])
+            else:
+                # Re-read the status in case the task expired or an update was missed
+                stored_task = await get_task(task_id) or {"status": "not found"}
+                if stored_task == task:
+                    continue
+                task = stored_task
+
+            await websocket.send_json(task)
+    except WebSocketDisconnect:
+        return
+    finally:
+        disconnected.cancel()
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+
+    await websocket.close()
+
+
 @app.post("/transcribe-local/")
 async def transcribe_local_file(
     background_tasks: BackgroundTasks, file: UploadFile = File(...)
@@ -188,7 +1186,8 @@ async def transcribe_local_file(
 
     This endpoint receives an audio file uploaded by the user, creates a task ID,
     and enqueues a background task to process and transcribe the audio file.
-    It returns the task ID for status tracking.
+    Files that were already transcribed are completed immediately from the
+    transcription cache. It returns the task ID for status tracking.
 
     Args:
         background_tasks (BackgroundTasks): FastAPI utility for background task execution.
@@ -200,11 +1199,23 @@ async def transcribe_local_file(
     # Generate a unique task ID for this transcription request
     task_id = create_task_id()
 
-    # Set the initial status of the task
-    tasks[task_id] = {"status": "processing"}
+    # Read the upload and look for a cached transcription of the same content
+    audio_bytes = await file.read()
+    cache_key = await run_in_threadpool(file_cache_key, audio_bytes)
+    transcription = await get_cached_transcription(cache_key)
 
-    # Enqueue the audio processing and transcription task
-    background_tasks.add_task(process_local_audio_file, task_id, file)
+    if transcription is not None:
+        await update_task(
+            task_id, {"status": "completed", "transcription": transcription}
+        )
+    else:
+        # Set the initial status of the task
+        await update_task(task_id, {"status": "processing"})
+
+        # Enqueue the audio processing and transcription task
+        background_tasks.add_task(
+            process_local_audio_file, task_id, audio_bytes, cache_key
+        )
 
     # Return the task ID for status tracking
     return {"task_id": task_id}
@@ -219,8 +1230,10 @@ async def transcribe_youtube(
 
     This endpoint receives a YouTube URL, creates a task ID for tracking,
     and enqueues a background task to download the video's audio and
-    transcribe it. The task ID is returned for the client to track the
-    status of the transcription process.
+    transcribe it. Videos that were already transcribed are completed
+    immediately from the transcription cache, and URLs that are not those of
+    a YouTube video fail immediately. The task ID is returned for the client
+    to track the status of the transcription process.
 
     Args:
         background_tasks (BackgroundTasks): FastAPI utility for background task execution.
@@ -232,13 +1245,28 @@ async def transcribe_youtube(
     # Generate a unique task ID for this transcription request
     task_id = create_task_id()
 
-    # Set the initial status of the task
-    tasks[task_id] = {"status": "processing"}
+    # Only the ID of a YouTube video is handed over to yt-dlp
+    video_id = youtube_video_id(youtube_url.youtube_url)
+    if video_id is None:
+        await update_task(
+            task_id, {"status": "failed", "error": "Invalid YouTube video URL"}
+        )
+        return {"task_id": task_id}
 
-    # Enqueue the task for downloading and transcribing the YouTube audio
-    background_tasks.add_task(
-        process_youtube_audio, task_id, download_youtube_audio(youtube_url.youtube_url)
-    )
+    # Look for a cached transcription of the same video
+    cache_key = youtube_cache_key(youtube_url.youtube_url)
+    transcription = await get_cached_transcription(cache_key)
+
+    if transcription is not None:
+        await update_task(
+            task_id, {"status": "completed", "transcription": transcription}
+        )
+    else:
+        # Set the initial status of the task
+        await update_task(task_id, {"status": "processing"})
+
+        # Enqueue the task for downloading and transcribing the YouTube audio
+        background_tasks.add_task(process_youtube_audio, task_id, video_id, cache_key)
 
     # Return the task ID for status tracking
     return {"task_id": task_id}
@@ -252,6 +1280,8 @@ async def transcribe_websocket_stream(websocket: WebSocket) -> None:
     This endpoint handles a WebSocket connection for real-time audio data streaming.
     It receives audio data from the client, transcribes it using the Whisper model,
     and sends the transcription text back to the client through the WebSocket.
+    Frames shorter than a second are buffered and answered with an empty text until
+    enough audio has been received, as are silent chunks, without running the model.
 
     Args:
         websocket (WebSocket): The WebSocket connection with the client.
@@ -260,17 +1290,29 @@ async def transcribe_websocket_stream(websocket: WebSocket) -> None:
         Exception: If an error occurs during the WebSocket communication or transcription process.
     """
     await websocket.accept()
+
+    # Buffer for short frames, allocated once for the whole connection
+    audio_buffer = LiveAudioBuffer(LIVE_MIN_SAMPLES, LIVE_BUFFER_SAMPLES)
     try:
         while True:
             # Receive audio data from the client
             data = await websocket.receive_bytes()
 
-            # Convert the received data to a NumPy array and process it
-            updated_data = np.frombuffer(data, dtype=np.float32).copy()
-            transcription = model.transcribe(updated_data)
+            # View the received data as a NumPy array without copying it, the
+            # model only reads the samples so the read-only buffer can be used as is
+            updated_data = audio_buffer.push(np.frombuffer(data, dtype=np.float32))
+
+            # Skip the model until enough audio has been received, and for silent
+            # chunks, where it would only hallucinate text
+            if updated_data is None or is_silent(updated_data):
+                transcription = ""
+            else:
+                transcription = await run_in_threadpool(
+                    transcribe_audio, updated_data, without_timestamps=True
+                )
 
             # Send the transcription result back to the client
-            await websocket.send_text(transcription["text"])
+            await websocket.send_text(transcription)
     except Exception as e:
         # Log any exceptions that occur
         print(f"Error in WebSocket communication: {e}")
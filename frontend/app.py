@@ -1,7 +1,7 @@
 import streamlit as st
 
 from constants import (
-    STATUS_ENDPOINT,
+    STATUS_WEBSOCKET_ENDPOINT,
     LOCAL_FILE__TRANSCRIPTION_ENDPOINT,
     YOUTUBE_TRANSCRIPTION_ENDPOINT,
     LIVE_TRANSCRIPTION_WEBSOCKET_ENDPOINT,
@@ -47,13 +47,13 @@ if __name__ == "__main__":
 
         # Define the endpoint of your FastAPI service
         fastapi_endpoint = LOCAL_FILE__TRANSCRIPTION_ENDPOINT
-        status_endpoint = STATUS_ENDPOINT  # Endpoint to check the status
+        status_websocket_endpoint = STATUS_WEBSOCKET_ENDPOINT  # Status stream
 
         # If the file is loaded and transcribe button is pressed, process the audio
         if uploaded_file is not None:
             if st.button("Transcribe Audio"):
                 handle_local_file_transcription(
-                    uploaded_file, fastapi_endpoint, status_endpoint
+                    uploaded_file, fastapi_endpoint, status_websocket_endpoint
                 )
 
     if transcription_mode == "Transcribe from YouTube URL":
@@ -61,13 +61,13 @@ if __name__ == "__main__":
         youtube_url = st.text_input("Enter YouTube Video URL")
         # Define the endpoint of your FastAPI service
         fastapi_endpoint_youtube = YOUTUBE_TRANSCRIPTION_ENDPOINT
-        status_endpoint = STATUS_ENDPOINT
+        status_websocket_endpoint = STATUS_WEBSOCKET_ENDPOINT
 
         # Handling the transcription request
         if youtube_url:
             if st.button("Transcribe Video"):
                 handle_youtube_transcription(
-                    youtube_url, fastapi_endpoint_youtube, status_endpoint
+                    youtube_url, fastapi_endpoint_youtube, status_websocket_endpoint
                 )
 
     if transcription_mode == "Transcribe Live":
@@ -1,5 +1,6 @@
 # Constants for transcription
 STATUS_ENDPOINT = "http://localhost:8000/status"
+STATUS_WEBSOCKET_ENDPOINT = "ws://localhost:8000/status-ws"
 
 LOCAL_FILE__TRANSCRIPTION_ENDPOINT = "http://localhost:8000/transcribe-local"
 YOUTUBE_TRANSCRIPTION_ENDPOINT = "http://localhost:8000/transcribe-youtube"
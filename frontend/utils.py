@@ -1,5 +1,5 @@
-import time
-from typing import Optional
+import json
+from typing import Callable, Dict, Optional
 
 import requests
 import streamlit as st
@@ -7,20 +7,53 @@ from streamlit.runtime.uploaded_file_manager import UploadedFile
 from transformers.pipelines.audio_utils import ffmpeg_microphone_live
 from websockets.sync.client import connect
 
+# Shared HTTP session, keeping connections to the backend alive across requests
+_SESSION = requests.Session()
+
+
+def wait_for_task(
+    status_websocket_endpoint: str,
+    task_id: str,
+    on_update: Optional[Callable[[Dict[str, str]], None]] = None,
+) -> Dict[str, str]:
+    """
+    Waits for a transcription task to finish by listening to the status updates
+    pushed by the FastAPI backend over a WebSocket.
+
+    Args:
+        status_websocket_endpoint (str): The WebSocket URL streaming the task status.
+        task_id (str): The unique identifier of the transcription task.
+        on_update (Optional[Callable[[Dict[str, str]], None]]): Called with every
+            status received while the task is still processing.
+
+    Returns:
+        Dict[str, str]: The final status of the task.
+    """
+    with connect(f"{status_websocket_endpoint}/{task_id}") as websocket:
+        while True:
+            result = json.loads(websocket.recv())
+
+            # Return once the task is no longer processing
+            if result.get("status") != "processing":
+                return result
+
+            if on_update is not None:
+                on_update(result)
+
 
 def handle_local_file_transcription(
     uploaded_file: UploadedFile,
     fastapi_endpoint: str,
-    status_endpoint: str,
+    status_websocket_endpoint: str,
 ) -> Optional[str]:
     """
     Handles the transcription of a locally uploaded file by sending it to a FastAPI backend,
-    polling for the transcription results, and displaying them in the Streamlit app.
+    waiting for the transcription results, and displaying them in the Streamlit app.
 
     Args:
         uploaded_file (UploadedFile): The uploaded file object from Streamlit.
         fastapi_endpoint (str): The endpoint URL for the FastAPI transcription service.
-        status_endpoint (str): The endpoint URL to check the status of the transcription task.
+        status_websocket_endpoint (str): The WebSocket URL streaming the status of the transcription task.
 
     Returns:
         Optional[str]: The task ID if the transcription is started successfully, otherwise None.
@@ -28,35 +61,27 @@ def handle_local_file_transcription(
 
     try:
         files = {"file": uploaded_file.getvalue()}
-        response = requests.post(fastapi_endpoint, files=files)
+        response = _SESSION.post(fastapi_endpoint, files=files)
 
         if response.status_code == 200:
             task_id = response.json().get("task_id")
             st.write("Processing... Please wait.")
 
-            # Continuously poll for results
-            while True:
-                response = requests.get(f"{status_endpoint}/{task_id}")
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("status") == "completed":
-                        transcription = result.get("transcription")
-                        st.text_area(
-                            "Transcribed text", value=transcription, height=500
-                        )
-
-                        # Option to download the transcription
-                        st.download_button(
-                            label="Download Transcription",
-                            data=transcription,
-                            file_name="transcription.txt",
-                            mime="text/plain",
-                        )
-                        break  # Exit loop if transcription is completed
-                    elif result.get("status") == "failed":
-                        st.error("Transcription failed.")
-                        break  # Exit loop if transcription fails
-                time.sleep(0.5)  # Delay between polling requests
+            # Wait for the backend to push the final status of the task
+            result = wait_for_task(status_websocket_endpoint, task_id)
+            if result.get("status") == "completed":
+                transcription = result.get("transcription")
+                st.text_area("Transcribed text", value=transcription, height=500)
+
+                # Option to download the transcription
+                st.download_button(
+                    label="Download Transcription",
+                    data=transcription,
+                    file_name="transcription.txt",
+                    mime="text/plain",
+                )
+            else:
+                st.error("Transcription failed.")
         else:
             st.error("Failed to start transcription process.")
             return None
@@ -69,16 +94,16 @@ def handle_local_file_transcription(
 
 
 def handle_youtube_transcription(
-    youtube_url: str, fastapi_endpoint_youtube: str, status_endpoint: str
+    youtube_url: str, fastapi_endpoint_youtube: str, status_websocket_endpoint: str
 ) -> Optional[str]:
     """
     Handles the transcription of a YouTube video by sending its URL to a FastAPI backend,
-    polling for the transcription results, and displaying them in the Streamlit app.
+    waiting for the transcription results, and displaying them in the Streamlit app.
 
     Args:
         youtube_url (str): The URL of the YouTube video to be transcribed.
         fastapi_endpoint_youtube (str): The endpoint URL for the FastAPI YouTube transcription service.
-        status_endpoint (str): The endpoint URL to check the status of the transcription task.
+        status_websocket_endpoint (str): The WebSocket URL streaming the status of the transcription task.
 
     Returns:
         Optional[str]: The task ID if the transcription is started successfully, otherwise None.
@@ -86,7 +111,7 @@ def handle_youtube_transcription(
 
     try:
         # Send the YouTube URL to the FastAPI backend
-        response = requests.post(
+        response = _SESSION.post(
             fastapi_endpoint_youtube, json={"youtube_url": youtube_url}
         )
 
@@ -96,29 +121,31 @@ def handle_youtube_transcription(
                 "Processing... Please wait. This may take some time for long youtube videos"
             )
 
-            # Continuously poll for results
-            while True:
-                response = requests.get(f"{status_endpoint}/{task_id}")
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("status") == "completed":
-                        transcription = result.get("transcription")
-                        st.text_area(
-                            "Transcribed text", value=transcription, height=500
-                        )
-
-                        # Option to download the transcription
-                        st.download_button(
-                            label="Download Transcription",
-                            data=transcription,
-                            file_name="transcription.txt",
-                            mime="text/plain",
-                        )
-                        break  # Exit loop if transcription is completed
-                    elif result.get("status") == "failed":
-                        st.error("Transcription failed.")
-                        break  # Exit loop if transcription fails
-                time.sleep(0.5)  # Delay between polling requests
+            # Display the partial transcription while the video is processed
+            partial_display = st.empty()
+
+            def display_partial_transcription(result: Dict[str, str]) -> None:
+                partial_display.text(result.get("transcription", ""))
+
+            # Wait for the backend to push the final status of the task
+            result = wait_for_task(
+                status_websocket_endpoint, task_id, display_partial_transcription
+            )
+            partial_display.empty()
+
+            if result.get("status") == "completed":
+                transcription = result.get("transcription")
+                st.text_area("Transcribed text", value=transcription, height=500)
+
+                # Option to download the transcription
+                st.download_button(
+                    label="Download Transcription",
+                    data=transcription,
+                    file_name="transcription.txt",
+                    mime="text/plain",
+                )
+            else:
+                st.error("Transcription failed.")
         else:
             st.error("Failed to start transcription process.")
             return None